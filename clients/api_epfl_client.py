@@ -101,6 +101,21 @@ class Client(APIClient):
             )
             return result
 
+        # Skip si lastname trop court et firstname trop court aussi: checked
+        # before any request, the answer would be discarded anyway
+        if (
+            query
+            and lastname
+            and len(lastname) < 2
+            and firstname
+            and len(firstname) < 2
+        ):
+            self.logger.warning(
+                f"Skipping personsQuery because lastname='{lastname}' "
+                f"is too short and firstname='{firstname}' has only one character."
+            )
+            return None
+
         # Initialize results
         results = []
 
@@ -118,27 +133,21 @@ class Client(APIClient):
                     self.logger.error(f"{lastname} {firstname} caused an EPFL API error")
                     pass
 
-                self.logger.debug(
-                    "EPFL API: personsFirstnameLastname query for %s %s", firstname, lastname
-                )
-                try:
-                    results.append(attempt_query(firstname, lastname))
-                except exceptions.ServerError:
-                    self.logger.error(f"{firstname} {lastname} caused an EPFL API error")
-                    pass
+                # Swapped order is the same request when both names are equal
+                if firstname != lastname:
+                    self.logger.debug(
+                        "EPFL API: personsFirstnameLastname query for %s %s", firstname, lastname
+                    )
+                    try:
+                        results.append(attempt_query(firstname, lastname))
+                    except exceptions.ServerError:
+                        self.logger.error(f"{firstname} {lastname} caused an EPFL API error")
+                        pass
             else:
                 self.logger.debug("EPFL API: firstname or lastname missing, skipping")
 
         # Always attempt personsQuery
         if query:
-            # Skip si lastname trop court et firstname trop court aussi
-            if lastname and len(lastname) < 2 and firstname and len(firstname) < 2:
-                self.logger.warning(
-                    f"Skipping personsQuery because lastname='{lastname}' "
-                    f"is too short and firstname='{firstname}' has only one character."
-                )
-                return None
-
             self.logger.debug("EPFL API: personsQuery for %s", query)
             result_query = self.get(Endpoint.personsQuery.format(query=query))
             self.logger.debug(
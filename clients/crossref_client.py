@@ -74,8 +74,7 @@ class Client(APIClient):
         param_kwargs["rows"] = rows
         param_kwargs["offset"] = offset
 
-        self.params = param_kwargs
-        return self.get(CrossrefEndpoint.works, params=self.params)
+        return self.get(CrossrefEndpoint.works, params=param_kwargs)
 
     @retry_request
     def count_results(self, **param_kwargs) -> int:
@@ -97,8 +96,7 @@ class Client(APIClient):
         param_kwargs["rows"] = 1
         param_kwargs["offset"] = 0
 
-        self.params = param_kwargs
-        result = self.search_query(**self.params)
+        result = self.search_query(**param_kwargs)
         return result["message"]["total-results"]
 
     @retry_decorator
@@ -123,8 +121,7 @@ class Client(APIClient):
         param_kwargs["rows"] = rows
         param_kwargs["offset"] = offset
 
-        self.params = param_kwargs
-        results = self.search_query(**self.params)
+        results = self.search_query(**param_kwargs)
         items = results["message"]["items"]
         return [x.get("DOI", "") for x in items]
 
@@ -144,15 +141,12 @@ class Client(APIClient):
         if crossref_email:
             param_kwargs.setdefault("mailto", crossref_email)
 
-        # Save for reuse/debugging if needed
-        self.params = param_kwargs
-
         # Perform the API query
-        result = self.search_query(**self.params)
+        result = self.search_query(**param_kwargs)
 
         # Process only if results are found
         if result.get("message", {}).get("total-results", 0) > 0:
-            return self._process_fetch_records(format, **self.params)
+            return self._process_fetch_records(format, **param_kwargs)
 
         return None
 
@@ -168,12 +162,9 @@ class Client(APIClient):
         Returns:
             dict: The processed metadata record.
         """
-        if crossref_email:
-            self.params = {"mailto": crossref_email}
-        else:
-            self.params = {}
+        params = {"mailto": crossref_email} if crossref_email else {}
 
-        result = self.get(CrossrefEndpoint.work_doi.format(doi=doi), params=self.params)
+        result = self.get(CrossrefEndpoint.work_doi.format(doi=doi), params=params)
 
         return (
             self._process_record(result["message"], format=format)
@@ -192,7 +183,7 @@ class Client(APIClient):
         Returns:
             A list of processed records.
         """
-        records = self.search_query(**self.params)["message"]["items"]
+        records = self.search_query(**param_kwargs)["message"]["items"]
         if format == "digest":
             return [self._extract_digest_record_info(record) for record in records]
         elif format == "digest-ifs3":
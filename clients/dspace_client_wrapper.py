@@ -309,6 +309,82 @@ class DSpaceClientWrapper:
             )
             return None
 
+    def find_persons_by_identifier(self, field, values, chunk_size=50):
+        """
+        Batched equivalent of `find_person` for exact identifier queries.
+
+        Values are OR-joined into one search per chunk and each returned person is
+        matched back to the requested values through its `field` metadata.
+
+        param field: identifier index, for example person.identifier.orcid
+        param values: identifier values to look up
+        param chunk_size: number of values per search request
+
+        Returns a dict value -> {"uuid", "sciper_id"} for a single match, or None
+        when the batch settled that no single person carries the value (no hit,
+        or several persons). Values that are not in the dict belong to a chunk the
+        batch could not settle (failed, truncated or ambiguous search) and should be
+        looked up individually with `find_person`.
+        """
+        resolved = {}
+        values = list(dict.fromkeys(str(v).strip() for v in values if str(v).strip()))
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            query = " OR ".join(f"{field}:({value})" for value in chunk)
+            page_size = 2 * len(chunk)
+            try:
+                dsos_persons = self._search_objects(
+                    query=query,
+                    size=page_size,
+                    configuration="person",
+                )
+            except Exception as e:
+                self.logger.error("Batched DSpace person search failed for %s: %s", field, e)
+                continue
+            if len(dsos_persons) >= page_size:
+                # Possibly truncated: a value could have more matches than returned
+                self.logger.debug("Batched DSpace person search truncated for %s", field)
+                continue
+
+            wanted = {value.lower() for value in chunk}
+            matches = {}
+            unattributed = False
+            for person in dsos_persons:
+                metadata = getattr(person, "metadata", {}) or {}
+                person_values = {
+                    str(entry.get("value", "")).strip().lower()
+                    for entry in metadata.get(field, [])
+                } & wanted
+                if not person_values:
+                    unattributed = True
+                for value in person_values:
+                    matches.setdefault(value, []).append(person)
+            if unattributed:
+                # A hit whose metadata does not echo any requested value (e.g. a
+                # differently formatted identifier) could belong to any of them
+                self.logger.debug("Batched DSpace person search ambiguous for %s", field)
+                continue
+
+            for value in chunk:
+                persons = matches.get(value.lower(), [])
+                if len(persons) == 1:
+                    sciper_metadata = persons[0].metadata.get("epfl.sciperId")
+                    resolved[value] = {
+                        "uuid": persons[0].uuid,
+                        "sciper_id": (
+                            sciper_metadata[0]["value"] if sciper_metadata else ""
+                        ),
+                    }
+                elif len(persons) > 1:
+                    self.logger.warning(
+                        f"Multiple records found for {field}:({value}) in DspaceCris: {len(persons)} results."
+                    )
+                    resolved[value] = None
+                else:
+                    # Complete, fully attributed page: the value has no match
+                    resolved[value] = None
+        return resolved
+
     def push_publication(self, source, wos_id, collection_id):
         try:
             # Attempt to create a workspace item from the external source
@@ -70,9 +70,7 @@ class Client(APIClient):
         Returns
         A json object of Wos records
         """
-        self.params = {**param_kwargs}
-        # return self.get(wos_api_base_url, params=self.params)
-        return self.get(Endpoint.search, params=self.params)
+        return self.get(Endpoint.search, params=param_kwargs)
 
     @retry_request
     def count_results(self, **param_kwargs) -> int:
@@ -95,8 +93,7 @@ class Client(APIClient):
         param_kwargs.setdefault("count", 1)
         param_kwargs.setdefault("start", 0)
         param_kwargs.setdefault("field", "dc:identifier")  # to get minimal records
-        self.params = {**param_kwargs}
-        return self.search_query(**self.params)["search-results"][
+        return self.search_query(**param_kwargs)["search-results"][
             "opensearch:totalResults"
         ]
 
@@ -109,8 +106,7 @@ class Client(APIClient):
         param_kwargs.setdefault("start", 0)
         param_kwargs.setdefault("field", "dc:identifier")  # Minimal records
 
-        self.params = {**param_kwargs}
-        response = self.search_query(**self.params)
+        response = self.search_query(**param_kwargs)
         entries = response.get("search-results", {}).get("entry", [])
 
         if not entries:
@@ -1,11 +1,13 @@
 """Unpaywall client for Infoscience imports"""
 
 import os
+import json
 from typing import List, Tuple, Optional
 from urllib.parse import urljoin
 from pathlib import Path
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import tenacity
 
 from apiclient import (
@@ -14,11 +16,17 @@ from apiclient import (
     retry_request,
     JsonResponseHandler,
 )
+from apiclient.exceptions import ResponseParseError
 from apiclient.retrying import retry_if_api_request_error
 from dotenv import load_dotenv
 from config import LICENSE_CONDITIONS
 from utils import get_pipeline_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional — stdlib json fallback
+
 load_dotenv(os.path.join(os.getcwd(), ".env"))
 email = os.environ.get("CONTACT_API_EMAIL")
 
@@ -44,6 +52,24 @@ output_dir.mkdir(parents=True, exist_ok=True)
 
 PDF_FOLDER = output_dir
 
+# Keep-alive connections kept per host. DOIs are looked up concurrently by the
+# enrichment thread pool; with requests' default of 10, connections beyond that
+# are dropped after each call and the next request pays a new TLS handshake.
+HTTP_POOL_MAXSIZE = 64
+
+
+def pooled_session() -> requests.Session:
+    """Return a requests.Session sized for concurrent lookups on the same host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by the Crossref full-text link lookups (always the same host)
+http_session = pooled_session()
+
 
 def ensure_pdf_folder():
     try:
@@ -59,6 +85,27 @@ def ensure_pdf_folder():
         logger.error(f"Error during PDF directory check : {str(e)}")
 
 
+class BytesJsonResponseHandler(JsonResponseHandler):
+    """
+    Decode the raw response body once, with orjson when it is installed.
+
+    JsonResponseHandler first builds `response.text` (a full unicode decode) only
+    to test for an empty body, then parses it again with `response.json()`.
+    """
+
+    @staticmethod
+    def get_request_data(response):
+        body = response.get_original().content
+        if not body:
+            return None
+        try:
+            return orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError as error:  # orjson.JSONDecodeError subclasses ValueError
+            raise ResponseParseError(
+                f"Unable to decode response data to json. data='{response.get_raw_data()}'"
+            ) from error
+
+
 @endpoint(base_url=unpaywall_base_url)
 class Endpoint:
     base = ""
@@ -70,10 +117,9 @@ class Client(APIClient):
         logger.info("Starting Unpaywall DOI retrieval process.")
 
         param_kwargs.setdefault("email", email)
-        self.params = {**param_kwargs}
 
         try:
-            result = self.get(Endpoint.doi.format(doi=doi), params=self.params)
+            result = self.get(Endpoint.doi.format(doi=doi), params=param_kwargs)
             logger.debug(f"Unpaywall response for DOI '{doi}': {result}")
             # Check if the result indicates an error
             if result.get("HTTP_status_code") == 404 and result.get("error"):
@@ -389,7 +435,7 @@ class Client(APIClient):
         url = f"{base_url}{doi}?mailto={email}"
 
         try:
-            response = requests.get(url, timeout=10)
+            response = http_session.get(url, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -416,5 +462,6 @@ class Client(APIClient):
 
 
 UnpaywallClient = Client(
-    response_handler=JsonResponseHandler,
+    response_handler=BytesJsonResponseHandler,
 )
+UnpaywallClient.set_session(pooled_session())
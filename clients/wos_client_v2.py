@@ -68,9 +68,7 @@ class Client(APIClient):
         A json object of Wos records
         """
         param_kwargs.setdefault('databaseId', "WOS")
-        self.params = param_kwargs
-        # return self.get(wos_api_base_url, params=self.params)
-        return self.get(Endpoint.base, params=self.params)
+        return self.get(Endpoint.base, params=param_kwargs)
 
     @retry_request
     def count_results(self, **param_kwargs)-> int:
@@ -95,8 +93,7 @@ class Client(APIClient):
         param_kwargs.setdefault('viewField', "UID")
         param_kwargs.setdefault('count', 1)
         param_kwargs.setdefault('firstRecord', 1)
-        self.params = {**param_kwargs}
-        return self.search_query(**self.params)["QueryResult"]["RecordsFound"]
+        return self.search_query(**param_kwargs)["QueryResult"]["RecordsFound"]
 
     @retry_decorator
     def fetch_ids(self, **param_kwargs)->List[str]:
@@ -129,8 +126,7 @@ class Client(APIClient):
         param_kwargs.setdefault('viewField', "UID")
         param_kwargs.setdefault('count', 10)
         param_kwargs.setdefault('firstRecord', 1)
-        self.params = {**param_kwargs}
-        return [x["UID"] for x in self.search_query(**self.params)["Data"]["Records"]["records"]["REC"]]
+        return [x["UID"] for x in self.search_query(**param_kwargs)["Data"]["Records"]["records"]["REC"]]
 
     @retry_decorator
     def fetch_records(self, format="digest",**param_kwargs):
@@ -165,10 +161,9 @@ class Client(APIClient):
         param_kwargs.setdefault('databaseId', "WOS")
         param_kwargs.setdefault('count', 10)
         param_kwargs.setdefault('firstRecord', 1)
-        self.params = {**param_kwargs}
-        result = self.search_query(**self.params)
+        result = self.search_query(**param_kwargs)
         if result["QueryResult"]["RecordsFound"] > 0:
-            return self._process_fetch_records(format,**self.params)
+            return self._process_fetch_records(format,**param_kwargs)
         return None
 
     @retry_decorator
@@ -191,8 +186,8 @@ class Client(APIClient):
         WosClient.fetch_record_by_unique_id("WOS:001173421300001", format="wos")
         WosClient.fetch_record_by_unique_id("WOS:001173421300001", format="ifs3")
         """
-        self.params = {"databaseId": "WOS", "count": 1, "firstRecord": 1}
-        result = self.get(Endpoint.uniqueId.format(wosId=wos_id), params=self.params)
+        params = {"databaseId": "WOS", "count": 1, "firstRecord": 1}
+        result = self.get(Endpoint.uniqueId.format(wosId=wos_id), params=params)
         if result["QueryResult"]["RecordsFound"] == 1:
             return self._process_record(result["Data"]["Records"]["records"]["REC"][0], format)
         return None
@@ -200,18 +195,14 @@ class Client(APIClient):
     def _process_fetch_records(self, format,**param_kwargs):
         if format == "digest":
             param_kwargs.setdefault('optionView', "SR")
-            self.params = param_kwargs
-            return [self._extract_digest_record_info(x) for x in self.search_query(**self.params)["Data"]["Records"]["records"]["REC"]]
+            return [self._extract_digest_record_info(x) for x in self.search_query(**param_kwargs)["Data"]["Records"]["records"]["REC"]]
         elif format == "digest-ifs3":
             param_kwargs.setdefault('optionView', "SR")
-            self.params = param_kwargs
-            return [self._extract_ifs3_digest_record_info(x) for x in self.search_query(**self.params)["Data"]["Records"]["records"]["REC"]]
+            return [self._extract_ifs3_digest_record_info(x) for x in self.search_query(**param_kwargs)["Data"]["Records"]["records"]["REC"]]
         elif format == "ifs3":
-            self.params = param_kwargs
-            return [self._extract_ifs3_record_info(x) for x in self.search_query(**self.params)["Data"]["Records"]["records"]["REC"]]
+            return [self._extract_ifs3_record_info(x) for x in self.search_query(**param_kwargs)["Data"]["Records"]["records"]["REC"]]
         elif format == "wos":
-            self.params = param_kwargs
-            return self.search_query(**self.params)["Data"]["Records"]["records"]["REC"]
+            return self.search_query(**param_kwargs)["Data"]["Records"]["records"]["REC"]
 
     def _process_record(self, record, format):
         if format == "digest":
@@ -29,6 +29,39 @@ source_order = [
     "epo",
 ]
 
+# Size of the thread pool shared by the enrichment stage for network-bound
+# lookups (Unpaywall, EPFL API). Overridable with ENRICHMENT_MAX_WORKERS.
+enrichment_max_workers = 32
+
+# Days a DSpace identifier lookup (sciper / ORCID / author id -> person) is
+# reused from the on-disk lookup cache. Overridable with LOOKUP_CACHE_TTL_DAYS;
+# 0 disables the cache.
+lookup_cache_ttl_days = 7
+
+# Same for EPFL API answers (status, position, accreditations). These change
+# when someone moves unit or leaves EPFL, so by default they only live for one
+# run; set EPFL_LOOKUP_CACHE_TTL_DAYS to opt in to a longer reuse window.
+epfl_lookup_cache_ttl_days = 0
+
+# Result pages fetched at once by the offset-paginated harvesters, per
+# provider. Kept low to stay within the per-key rate limits (WoS Expanded
+# allows a few requests per second, Scopus Search about 9). Overridable with
+# WOS_MAX_CONCURRENCY, SCOPUS_MAX_CONCURRENCY and CROSSREF_MAX_CONCURRENCY;
+# 1 fetches pages one after another.
+wos_max_concurrency = 2
+scopus_max_concurrency = 3
+crossref_max_concurrency = 3
+
+# Upper bound on requests the enrichment stage sends at once to each service,
+# whatever the size of the enrichment thread pool. The DSpace REST client keeps
+# session state (authentication, CSRF token) and is not known to be
+# thread-safe, so its calls are serialised. An Unpaywall lookup may also
+# download the PDF it points to. Overridable with DSPACE_MAX_CONCURRENCY,
+# EPFL_API_MAX_CONCURRENCY and UNPAYWALL_MAX_CONCURRENCY.
+dspace_max_concurrency = 1
+epfl_api_max_concurrency = 4
+unpaywall_max_concurrency = 5
+
 # Define types of unit to retrieve in priority from api.epfl.ch
 unit_types = [
     "Laboratoire",
@@ -80,7 +80,9 @@ class PDFUpdater:
         """Iterates over the DataFrame and updates the PDF file in DSpace workspaces."""
         updated_rows = []
 
-        for index, row in self.df_metadata.iterrows():
+        for index, row in zip(
+            self.df_metadata.index, self.df_metadata.to_dict("records")
+        ):
             uuid = row.get("uuid")
             pdf_filename = row.get("upw_valid_pdf")
 
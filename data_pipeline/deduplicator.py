@@ -12,9 +12,17 @@ from utils import get_pipeline_logger
 logger = get_pipeline_logger("deduplicator")
 
 class DataFrameProcessor:
-    def __init__(self, *dfs):
+    def __init__(self, *dfs, dspace_client: DSpaceClientWrapper = None):
         self.dataframes = dfs
         self.logger = logger
+        # Allow injection for testing; create lazily if not provided.
+        self._dspace_wrapper = dspace_client
+
+    @property
+    def dspace_wrapper(self) -> DSpaceClientWrapper:
+        if self._dspace_wrapper is None:
+            self._dspace_wrapper = DSpaceClientWrapper()
+        return self._dspace_wrapper
 
     def clean_title(self, title):
         # Remove HTML tags
@@ -148,7 +156,7 @@ class DataFrameProcessor:
         Deduplicate on existing Infoscience publications.
         """
         self.logger.info("Running Infoscience deduplication")
-        wrapper = DSpaceClientWrapper()
+        wrapper = self.dspace_wrapper
 
         # Apply the DSpaceClientWrapper.find_publication_duplicate function to each row
         df["is_duplicate"] = df.apply(
@@ -163,15 +171,15 @@ class DataFrameProcessor:
 
     def deduplicate_infoscience_enhanced(self, df):
         self.logger.debug("Falling back to metadata-based duplicate detection")
-        wrapper = DSpaceClientWrapper()
+        wrapper = self.dspace_wrapper
 
-        results = df.apply(
-            lambda row: wrapper.find_duplicate_enhanced(row), axis=1, result_type="expand"
+        # One dict per row, stacked once (no per-row Series expansion);
+        # built on df's index so the concat below stays aligned
+        results = pd.DataFrame(
+            [wrapper.find_duplicate_enhanced(row) for row in df.to_dict("records")],
+            index=df.index,
         )
 
-        # S'assurer que les index sont bien alignés
-        results.index = df.index
-
         # Fusionner proprement
         df_enhanced = pd.concat([df, results], axis=1)
 
@@ -194,13 +202,10 @@ class DataFrameProcessor:
         df["row_id"] = range(1, len(df) + 1)
         new_rows = []
 
-        # Iterate through each row in the DataFrame
-        for _, row in df.iterrows():
-            row_id = row["row_id"]
-            source = row["source"]
-            year = row["pubyear"]
-            authors = row["authors"]
-
+        # Iterate through each row in the DataFrame (plain tuples, no per-row Series)
+        for row_id, source, year, authors in df[
+            ["row_id", "source", "pubyear", "authors"]
+        ].itertuples(index=False, name=None):
             for author_data in authors:
                 new_row = {
                     "row_id": row_id,  # Ensure row_id is the first key
@@ -7,23 +7,192 @@ from datetime import datetime
 from collections import Counter
 import time
 from concurrent.futures import ThreadPoolExecutor
+import threading
 import unicodedata
 from unidecode import unidecode
+import numpy as np
 import pandas as pd
 from rapidfuzz import fuzz, process
 import nameparser
 from nameparser import HumanName
 from utils import get_pipeline_logger, clean_value
+from env_loader import env_int
 
 
 from clients.api_epfl_client import ApiEpflClient
 from clients.unpaywall_client import UnpaywallClient
 from clients.openalex_client import OpenAlexClient
 from clients.dspace_client_wrapper import DSpaceClientWrapper
-from config import scopus_epfl_afids, unit_types, excluded_unit_types
+from db.lookup_cache import LookupCache
+from config import (
+    scopus_epfl_afids,
+    unit_types,
+    excluded_unit_types,
+    enrichment_max_workers,
+    dspace_max_concurrency,
+    epfl_api_max_concurrency,
+    unpaywall_max_concurrency,
+    wos_max_concurrency,
+    scopus_max_concurrency,
+    crossref_max_concurrency,
+)
 
 logger = get_pipeline_logger("enricher")
 
+# Columns added by AuthorProcessor.reconcile_authors, in output order
+_RECONCILIATION_COLUMNS = [
+    "sciper_id",
+    "epfl_status",
+    "epfl_position",
+    "epfl_orcid",
+    "epfl_api_mainunit_id",
+    "epfl_api_mainunit_name",
+    "epfl_api_mainunit_type",
+    "dspace_uuid",
+    "guessing_mainunit",
+    "mainunit_match",
+    "final_mainunit",
+]
+
+# Name-cleaning helpers, built once instead of on every row
+# Dash-like characters between initials or names become spaces
+_DASH_TABLE = str.maketrans({dash: " " for dash in "-‐‑‒–—―⁃﹘﹣－"})
+# Periods become spaces (J. → J), any other punctuation is dropped
+_PUNCT_TABLE = str.maketrans(
+    {mark: " " if mark == "." else None for mark in string.punctuation}
+)
+_JOINED_INITIALS_RE = re.compile(r"\b([A-Z])\.\-?([A-Z])\.\b")
+
+
+def _trie_pattern(words):
+    """
+    Build a regex matching any of `words`, with alternatives factored as a prefix
+    trie (e.g. "600(?:28186|70536)").
+
+    `re` tries a flat alternation branch by branch at every position; sharing
+    prefixes lets one failed character rule out every word behind it, which gives
+    an Aho-Corasick-like single scan without a third-party automaton.
+    """
+    if not words:
+        return "(?!)"  # never matches
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # a word ends here
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+# One trie-shaped alternation over all Scopus EPFL AF-IDs: one scan per string
+# instead of one substring search per AF-ID
+_SCOPUS_AFID_RE = re.compile(_trie_pattern(scopus_epfl_afids))
+
+# EPFL affiliation patterns per source, compiled once at import
+_CROSSREF_EPFL_RE = re.compile("(?:EPFL|[Pp]olytechnique [Ff].d.rale de Lausanne)")
+_ZENODO_EPFL_RE = re.compile(
+    r"(?:EPFL"
+    r"|[Pp]olytechnique\s+[Ff].d.rale\s+de\s+Lausanne"
+    r"|[Ss]wiss\s+[Ff]ederal\s+[Ii]nstitute\s+of\s+[Tt]echnology\s+in\s+[Ll]ausanne)"
+)
+_OPENALEX_EPFL_RE = re.compile(
+    r"(?:02s376052|EPFL|[Pp]olytechnique [Ff].d.rale de Lausanne|02hdt9m26|Swiss Data Science Center)",
+    re.IGNORECASE,
+)
+# Matched against the output of AuthorProcessor._normalize_signature
+_DATACITE_EPFL_RE = re.compile(
+    r"\b(?:"
+    r"epfl"
+    r"|ecole\s+polytechnique\s+federale\s+de\s+lausanne"
+    r"|swiss\s+federal\s+institute\s+of\s+technology\s+in\s+lausanne"
+    r")\b"
+)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# Accreditation ranking: unit-type filters as sets for O(1) membership tests,
+# and the unit-label pattern that marks a laboratory
+_UNIT_TYPES = frozenset(unit_types)
+_EXCLUDED_UNIT_TYPES = frozenset(excluded_unit_types or ())
+_LABORATORY_RE = re.compile(r"\b(laboratoire|laboratory|lab|labo)\b", re.IGNORECASE)
+
+# Web of Science affiliation keywords and the minimum partial_ratio score for
+# a fuzzy match
+_WOS_KEYWORDS = (
+    "EPFL",
+    "Ecole Polytechnique Federale de Lausanne",
+    "Ecole Polytech Federale Lausanne",
+)
+_WOS_FUZZY_CUTOFF = 80
+# Verbatim occurrence of any keyword (case-sensitive, like the fuzzy scorer)
+_WOS_KEYWORDS_RE = re.compile("|".join(re.escape(keyword) for keyword in _WOS_KEYWORDS))
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+# Per-service request limits: environment variable and configured default
+_SERVICE_LIMIT_SETTINGS = {
+    "dspace": ("DSPACE_MAX_CONCURRENCY", dspace_max_concurrency),
+    "epfl_api": ("EPFL_API_MAX_CONCURRENCY", epfl_api_max_concurrency),
+    "unpaywall": ("UNPAYWALL_MAX_CONCURRENCY", unpaywall_max_concurrency),
+    "wos": ("WOS_MAX_CONCURRENCY", wos_max_concurrency),
+    "scopus": ("SCOPUS_MAX_CONCURRENCY", scopus_max_concurrency),
+    "crossref": ("CROSSREF_MAX_CONCURRENCY", crossref_max_concurrency),
+}
+_service_limits = {}
+
+
+def get_shared_executor():
+    """
+    Return the thread pool shared by the enrichment processors (and used by
+    the harvesters for concurrent result pages).
+
+    The pool is created on first use and lives for the rest of the process, so
+    successive stages and processors reuse the same worker threads instead of
+    spinning up a pool per call. Its size comes from ENRICHMENT_MAX_WORKERS,
+    read at creation time so that the active .env file is honoured.
+
+    Tasks running on this pool must not submit to it and wait on the result,
+    or the pool can deadlock once all workers are busy.
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            max_workers = env_int("ENRICHMENT_MAX_WORKERS", enrichment_max_workers)
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="enricher"
+            )
+        return _shared_executor
+
+
+def get_service_limit(service):
+    """
+    Return the semaphore bounding concurrent requests to `service`.
+
+    The shared pool can run up to ENRICHMENT_MAX_WORKERS lookups at once;
+    calls to a service ("dspace", "epfl_api", "unpaywall", and the "wos",
+    "scopus" and "crossref" harvest pages) are made while holding this
+    semaphore so that the service only sees as many parallel requests as
+    configured (<SERVICE>_MAX_CONCURRENCY, read on first use).
+    """
+    with _shared_executor_lock:
+        if service not in _service_limits:
+            env_name, default = _SERVICE_LIMIT_SETTINGS[service]
+            _service_limits[service] = threading.BoundedSemaphore(
+                max(1, env_int(env_name, default))
+            )
+        return _service_limits[service]
+
 
 class AuthorProcessor:
     """
@@ -39,16 +208,24 @@ class AuthorProcessor:
         process_scopus(text): Processes the organization text for Scopus publications to check for EPFL affiliations.
         process_wos(text): Processes the organization text for WOS publications to check for EPFL affiliations.
     Usage
-    processor = Processor(your_dataframe)
-    processor.process().nameparse_authors().orcid_data_reconciliation()
+    processor = AuthorProcessor(your_dataframe)
+    processor.process().filter_epfl_authors().clean_authors().nameparse_authors().reconcile_authors()
     """
 
-    def __init__(self, df, dspace_client: DSpaceClientWrapper = None):
+    def __init__(
+        self,
+        df,
+        dspace_client: DSpaceClientWrapper = None,
+        executor: ThreadPoolExecutor = None,
+        lookup_cache: LookupCache = None,
+    ):
         self.df = df
         self.logger = logger
         self._accred_cache = {}
         # Allow injection for testing; create lazily if not provided.
         self._dspace_wrapper = dspace_client
+        self._executor = executor
+        self._lookup_cache = lookup_cache
 
     @property
     def dspace_wrapper(self) -> DSpaceClientWrapper:
@@ -56,6 +233,21 @@ class AuthorProcessor:
             self._dspace_wrapper = DSpaceClientWrapper()
         return self._dspace_wrapper
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = get_shared_executor()
+        return self._executor
+
+    @property
+    def lookup_cache(self) -> LookupCache:
+        # Persistent tier under the in-memory caches: DSpace identifier lookups
+        # from previous runs (EPFL API answers only when opted in). Without an
+        # injected cache there is no file, and only the in-memory tiers apply.
+        if self._lookup_cache is None:
+            self._lookup_cache = LookupCache()
+        return self._lookup_cache
+
 
     def process(self, return_df=False, author_ids_to_check=None):
         """
@@ -71,30 +263,44 @@ class AuthorProcessor:
             DataFrame or self: Processed DataFrame if return_df is True, otherwise self.
         """
 
-        self.df = self.df.copy()
+        # New frame object so added columns never leak into the caller's DataFrame.
+        # Methods only add or replace whole columns, so the column data itself can
+        # stay shared (shallow copy, no memcpy of the frame).
+        self.df = self.df.copy(deep=False)
 
-        # Dispatch table: source name -> affiliation-detection method.
+        # Dispatch table: source name -> affiliation detection over the whole
+        # 'organizations' Series of that source (one call per source instead
+        # of one Python round-trip per row).
         # Extending to a new source only requires adding one entry here.
+        def _contains(pattern):
+            # Non-string organizations (None/NaN) count as not affiliated
+            return lambda orgs: orgs.astype(object).str.contains(pattern, na=False)
+
         _source_dispatch = {
-            "scopus": lambda orgs: self.process_scopus(orgs, check_all=True),
-            "wos": self.process_wos,
-            "openalex": self.process_openalex,
-            "openalex+crossref": self.process_openalex,
-            "crossref": self.process_crossref,
-            "zenodo": self.process_zenodo,
-            "datacite": self.process_datacite,
-            "epo": lambda _orgs: True,  # All inventors are candidates for EPO patents
+            "scopus": _contains(_SCOPUS_AFID_RE),
+            "wos": self._detect_wos_affiliation,
+            "openalex": _contains(_OPENALEX_EPFL_RE),
+            "openalex+crossref": _contains(_OPENALEX_EPFL_RE),
+            "crossref": _contains(_CROSSREF_EPFL_RE),
+            "zenodo": _contains(_ZENODO_EPFL_RE),
+            "datacite": lambda orgs: orgs.map(self.process_datacite),
+            "epo": lambda orgs: pd.Series(True, index=orgs.index),  # All inventors are candidates for EPO patents
         }
 
-        def _detect_affiliation(row):
-            handler = _source_dispatch.get(row["source"])
-            if handler is None:
-                self.logger.warning("Unknown source '%s' — epfl_affiliation set to False.", row["source"])
-                return False
-            return handler(row["organizations"])
-
         # Step 1: Detect EPFL-affiliated authors based on organization names
-        self.df["epfl_affiliation"] = self.df.apply(_detect_affiliation, axis=1)
+        affiliation = np.zeros(len(self.df), dtype=bool)
+        organizations = self.df["organizations"]
+        groups = self.df.groupby("source", sort=False, dropna=False).indices
+        for source, positions in groups.items():
+            handler = _source_dispatch.get(source)
+            if handler is None:
+                self.logger.warning(
+                    "Unknown source '%s' — epfl_affiliation set to False for %d rows.",
+                    source, len(positions),
+                )
+                continue
+            affiliation[positions] = handler(organizations.iloc[positions]).to_numpy(dtype=bool)
+        self.df["epfl_affiliation"] = affiliation
 
         if author_ids_to_check is not None:
             if author_ids_to_check:
@@ -106,14 +312,14 @@ class AuthorProcessor:
                     author_ids_to_check = [str(x).strip().lower() for x in author_ids_to_check]
                 author_ids_to_check = set(author_ids_to_check)
 
-                def check_and_log(row):
-                    internal_id = str(row.get("internal_author_id", "")).strip().lower()
-                    orcid_id = str(row.get("orcid_id", "")).strip().lower()
-                    if internal_id in author_ids_to_check or orcid_id in author_ids_to_check:
-                        return True
-                    return row["epfl_affiliation"]
-
-                self.df["epfl_affiliation"] = self.df.apply(check_and_log, axis=1)
+                # Rows whose internal author id or ORCID is one of the given ids are
+                # EPFL authors whatever their organizations say
+                matched = np.zeros(len(self.df), dtype=bool)
+                for col in ("internal_author_id", "orcid_id"):
+                    if col in self.df.columns:
+                        ids = self.df[col].astype(object).map(str).str.strip().str.lower()
+                        matched |= ids.isin(author_ids_to_check).to_numpy()
+                self.df["epfl_affiliation"] = self.df["epfl_affiliation"].to_numpy(dtype=bool) | matched
 
         return self.df if return_df else self
 
@@ -132,117 +338,122 @@ class AuthorProcessor:
         if not isinstance(text, str):
             return False
 
-        # Split the text into values separated by '|'
-        values = [v.strip() for v in text.split("|")]
-
         # Compare based on the check_all flag
         if check_all:
-            # Check all values
-            return any(any(value in v for value in scopus_epfl_afids) for v in values)
+            # Check all values: AF-IDs never contain '|', so scan the whole text
+            return bool(_SCOPUS_AFID_RE.search(text))
         else:
             # Check only the first value
-            return any(value in values[0] for value in scopus_epfl_afids)
+            return bool(_SCOPUS_AFID_RE.search(text.split("|", 1)[0]))
 
     def _normalize_signature(self, text: str) -> str:
         text = unicodedata.normalize("NFKD", text)
         text = "".join(ch for ch in text if not unicodedata.combining(ch))
         text = text.lower()
-        text = re.sub(r"[^a-z0-9]+", " ", text)
+        text = _NON_ALNUM_RE.sub(" ", text)
         return text.strip()
 
     def process_datacite(self, text):
         if not isinstance(text, str):
             return False
         norm = self._normalize_signature(text)
-        pattern = re.compile(
-            r"\b(?:"
-            r"epfl"
-            r"|ecole\s+polytechnique\s+federale\s+de\s+lausanne"
-            r"|swiss\s+federal\s+institute\s+of\s+technology\s+in\s+lausanne"
-            r")\b"
-        )
-        return bool(pattern.search(norm))
+        return bool(_DATACITE_EPFL_RE.search(norm))
 
     def process_zenodo(self, text):
         if not isinstance(text, str):
             return False
-        pattern = (
-            r"(?:EPFL"
-            r"|[Pp]olytechnique\s+[Ff].d.rale\s+de\s+Lausanne"
-            r"|[Ss]wiss\s+[Ff]ederal\s+[Ii]nstitute\s+of\s+[Tt]echnology\s+in\s+[Ll]ausanne)"
-        )
-        return bool(re.search(pattern, text))
+        return bool(_ZENODO_EPFL_RE.search(text))
 
     def process_crossref(self, text):
         if not isinstance(text, str):
             return False
-        pattern = "(?:EPFL|[Pp]olytechnique [Ff].d.rale de Lausanne)"
-        return bool(re.search(pattern, text))
+        return bool(_CROSSREF_EPFL_RE.search(text))
 
     def process_openalex(self, text):
         if not isinstance(text, str):
             return False
-        pattern = r"(02s376052|EPFL|[Pp]olytechnique [Ff].d.rale de Lausanne|02hdt9m26|Swiss Data Science Center)"
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        return bool(_OPENALEX_EPFL_RE.search(text))
 
     def process_wos(self, text):
-        keywords = [
-            "EPFL",
-            "Ecole Polytechnique Federale de Lausanne",
-            "Ecole Polytech Federale Lausanne",
-        ]
         if not isinstance(text, str):  # Vérifie que text est bien une chaîne
             return False
+        # A literal occurrence scores 100 anyway: only fall back to fuzzy matching
+        # when no keyword appears verbatim
+        if _WOS_KEYWORDS_RE.search(text):
+            return True
+        # score_cutoff lets rapidfuzz abandon a comparison as soon as the
+        # threshold can no longer be reached (it then returns 0)
         return any(
-            process.extractOne(keyword, [text], scorer=fuzz.partial_ratio)[1] >= 80
-            for keyword in keywords
+            fuzz.partial_ratio(keyword, text, score_cutoff=_WOS_FUZZY_CUTOFF)
+            for keyword in _WOS_KEYWORDS
         )
 
-    def filter_epfl_authors(self, return_df=False):
-        self.df = self.df.copy()
+    def _detect_wos_affiliation(self, orgs):
+        """
+        Vectorized equivalent of `process_wos` over a Series of organizations.
+
+        Verbatim keyword hits are resolved first; the remaining strings are
+        scored against all keywords in a single rapidfuzz `cdist` call.
+
+        Returns:
+            pd.Series: Boolean Series aligned on `orgs`.
+        """
+        texts = orgs.astype(object)
+        is_text = texts.map(lambda text: isinstance(text, str)).to_numpy(dtype=bool)
+        # One compiled-regex pass settles every string containing a keyword verbatim
+        detected = texts.str.contains(_WOS_KEYWORDS_RE, na=False).to_numpy(dtype=bool, copy=True)
+
+        fuzzy = is_text & ~detected
+        if fuzzy.any():
+            scores = process.cdist(
+                _WOS_KEYWORDS,
+                texts[fuzzy].tolist(),
+                scorer=fuzz.partial_ratio,
+                score_cutoff=_WOS_FUZZY_CUTOFF,
+                workers=-1,
+            )
+            detected[fuzzy] = (scores >= _WOS_FUZZY_CUTOFF).any(axis=0)
+        return pd.Series(detected, index=orgs.index)
 
+    def filter_epfl_authors(self, return_df=False):
+        # Boolean indexing already returns a new frame
         self.df = self.df[self.df['epfl_affiliation']]
         return self.df if return_df else self
 
     def clean_authors(self, return_df=False):
-        self.df = self.df.copy()
+        self.df = self.df.copy(deep=False)
 
-        def clean_author(author):
+        def format_name(author):
             parsed_name = HumanName(author)
             # Assemble name components
-            formatted_name = (
-                f"{parsed_name.last} {parsed_name.first} {parsed_name.middle}".strip()
-            )
+            return f"{parsed_name.last} {parsed_name.first} {parsed_name.middle}".strip()
 
-            # Transliterate characters to closest ASCII (e.g., ø → o, Μ → M)
-            formatted_name = unidecode(formatted_name)
+        # Authors repeat across publications: clean each distinct string once
+        unique_authors = self.df["author"].drop_duplicates()
 
-            # Replace dash-like characters between initials or names with space
-            formatted_name = re.sub(r"[-‐‑‒–—―⁃﹘﹣－]", " ", formatted_name)
+        # Transliterate characters to closest ASCII (e.g., ø → o, Μ → M)
+        names = unique_authors.map(format_name).map(unidecode)
 
+        cleaned = (
+            names
+            # Replace dash-like characters between initials or names with space
+            .str.translate(_DASH_TABLE)
             # Separate joined initials (e.g., J.-L. → J L)
-            formatted_name = re.sub(r"\b([A-Z])\.\-?([A-Z])\.\b", r"\1 \2", formatted_name)
-
-            # Remove remaining periods (e.g., J. → J)
-            formatted_name = formatted_name.replace(".", " ")
-
-            # Remove any leftover punctuation
-            formatted_name = formatted_name.translate(
-                str.maketrans("", "", string.punctuation)
-            )
-
+            .str.replace(_JOINED_INITIALS_RE, r"\1 \2", regex=True)
+            # Remove remaining periods (e.g., J. → J) and any leftover punctuation
+            .str.translate(_PUNCT_TABLE)
             # Normalize whitespace
-            formatted_name = re.sub(r"\s+", " ", formatted_name).strip()
-
-            return formatted_name
-
-        self.df["author_cleaned"] = self.df["author"].apply(clean_author)
+            .str.split()
+            .str.join(" ")
+        )
+        self.df["author_cleaned"] = self.df["author"].map(
+            dict(zip(unique_authors, cleaned))
+        )
 
         return self.df if return_df else self
 
     def nameparse_authors(self, return_df=False):
         parser = nameparser.HumanName
-        self.df = self.df.copy()  # Créer une copie du DataFrame si nécessaire
 
         def parse_name(author_name):
             # Essayer de détecter si le format est "Nom, Prénom" ou "Prénom Nom"
@@ -261,31 +472,16 @@ class AuthorProcessor:
             name = parser(first_name + " " + last_name)
             return name
 
-        # Appliquer le parsing à chaque ligne
-        self.df.loc[:, "nameparse_firstname"] = self.df.apply(
-            lambda row: (
-                " ".join(
-                    [parser(row["author"]).first, parser(row["author"]).middle]
-                    if row["epfl_affiliation"]
-                    else None
-                ).strip()
-                if row["epfl_affiliation"]
-                else None
-            ),
-            axis=1,
-        )
+        # Parse each distinct author once and derive both columns from the same
+        # HumanName
+        unique_authors = self.df["author"].drop_duplicates()
+        parsed = unique_authors.map(parse_name)
+        firstnames = parsed.map(lambda name: " ".join([name.first, name.middle]).strip())
+        lastnames = parsed.map(lambda name: name.last)
 
-        self.df.loc[:, "nameparse_lastname"] = self.df.apply(
-            lambda row: parser(row["author"]).last if row["epfl_affiliation"] else None,
-            axis=1,
-        )
-
-        # Correction des cas où le nom n'est pas bien divisé
-        self.df["nameparse_lastname"] = self.df["author"].apply(
-            lambda x: parse_name(x).last
-        )
-        self.df["nameparse_firstname"] = self.df["author"].apply(
-            lambda x: " ".join([parse_name(x).first, parse_name(x).middle]).strip()
+        self.df = self.df.assign(
+            nameparse_firstname=self.df["author"].map(dict(zip(unique_authors, firstnames))),
+            nameparse_lastname=self.df["author"].map(dict(zip(unique_authors, lastnames))),
         )
 
         return self.df if return_df else self
@@ -305,9 +501,16 @@ class AuthorProcessor:
             return self._accred_cache[sciper_id]
 
         if pd.notna(sciper_id):
-            records = ApiEpflClient.fetch_accred_by_unique_id(
-                sciper_id, format="digest"
-            )
+            cached = self.lookup_cache.get("epfl_accred", sciper_id)
+            if cached is not None:
+                main_unit = tuple(cached)
+                self._accred_cache[sciper_id] = main_unit
+                return main_unit
+
+            with get_service_limit("epfl_api"):
+                records = ApiEpflClient.fetch_accred_by_unique_id(
+                    sciper_id, format="digest"
+                )
             self.logger.debug("Person record: %s", records)
 
             if isinstance(records, list) and records:
@@ -325,27 +528,22 @@ class AuthorProcessor:
                     # Skip units with null, empty, or excluded unit_type
                     if not unit_type or unit_type in (None, "", "null"):
                         continue
-                    if (
-                        excluded_unit_types is not None
-                        and unit_type in excluded_unit_types
-                    ):
+                    if unit_type in _EXCLUDED_UNIT_TYPES:
                         continue
 
-                    # Check if unit_label contains 'laboratoire' or 'laboratory' (case-insensitive)
-                    name_matches_laboratory = isinstance(unit_label, str) and re.search(
-                        r"\b(laboratoire|laboratory|lab|labo)\b",
-                        unit_label,
-                        re.IGNORECASE,
+                    # Allowed unit type, or unit_label contains 'laboratoire' or
+                    # 'laboratory' (case-insensitive)
+                    is_allowed_unit = unit_type in _UNIT_TYPES or (
+                        isinstance(unit_label, str)
+                        and _LABORATORY_RE.search(unit_label) is not None
                     )
 
-                    if (
-                        unit_order == 1
-                        and (unit_type in unit_types or name_matches_laboratory)
-                        and not prioritized_unit
-                    ):
+                    if unit_order == 1 and is_allowed_unit:
+                        # Always wins: the remaining records cannot change the result
                         prioritized_unit = (unit_id, unit_name, unit_type)
+                        break
 
-                    if unit_type in unit_types or name_matches_laboratory:
+                    if is_allowed_unit:
                         allowed_units.append(
                             (unit_id, unit_name, unit_type, unit_order)
                         )
@@ -358,14 +556,15 @@ class AuthorProcessor:
                 if prioritized_unit:
                     main_unit = prioritized_unit
                 elif allowed_units:
-                    allowed_units.sort(key=lambda unit: unit[3])
-                    main_unit = allowed_units[0][:3]
+                    # Lowest unit_order wins (first one on ties, like a stable sort)
+                    main_unit = min(allowed_units, key=lambda unit: unit[3])[:3]
                 elif fallback_unit:
                     main_unit = fallback_unit
 
                 if main_unit:
                     self.logger.debug("Main unit retrieved: %s", main_unit)
                     self._accred_cache[sciper_id] = main_unit
+                    self.lookup_cache.set("epfl_accred", sciper_id, main_unit)
                     return main_unit
 
             default = ("10000", "EPFL", "Ecole")
@@ -373,8 +572,28 @@ class AuthorProcessor:
                 "No authorized unit type found. Returning EPFL Unit."
             )
             self._accred_cache[sciper_id] = default
+            if isinstance(records, list) and records:
+                # Derived from an actual answer, like main_unit above; an empty
+                # or failed lookup is not persisted (as for person lookups)
+                self.lookup_cache.set("epfl_accred", sciper_id, default)
             return default
 
+    def _prefetch_accred_info(self, sciper_ids):
+        """
+        Warm the accreditation cache for several scipers at once.
+
+        Lookups are network-bound, so scipers not yet cached are fetched through the
+        shared thread pool; later `_fetch_accred_info` calls are served from cache.
+
+        Args:
+            sciper_ids (iterable): Unique identifiers of the persons.
+        """
+        pending = [s for s in sciper_ids if s not in self._accred_cache]
+        if not pending:
+            return
+
+        list(self.executor.map(self._fetch_accred_info, pending))
+
     def _infer_unit_from_dspace_facets(self, sciper_id: str, year: int, facet="unitOrLab"):
         """
         Infer the most likely affiliation unit from DSpace publications using facet aggregation.
@@ -412,9 +631,10 @@ class AuthorProcessor:
                 f"AND (entityType:(Publication) NOT (types:(doctoral thesis) OR types_authority:(*student*)))"
             )
             try:
-                facet_values = self.dspace_wrapper.client.get_facet_values(
-                    facet_name=facet, query=query, configuration="researchoutputs", size=5
-                )
+                with get_service_limit("dspace"):
+                    facet_values = self.dspace_wrapper.client.get_facet_values(
+                        facet_name=facet, query=query, configuration="researchoutputs", size=5
+                    )
             except Exception as e:
                 self.logger.error(
                     "Error fetching facet values for sciper %s: %s", sciper_id, str(e)
@@ -448,7 +668,8 @@ class AuthorProcessor:
         """
 
         try:
-            response = self.dspace_wrapper.search_authority(filter_text=query)
+            with get_service_limit("dspace"):
+                response = self.dspace_wrapper.search_authority(filter_text=query)
             self.logger.debug("DSpace authority query for %s", query)
             sciper_id = self.dspace_wrapper.get_sciper_from_authority(response)
             self.logger.debug("DSpace: sciper %s matched for %s", sciper_id, query)
@@ -460,30 +681,87 @@ class AuthorProcessor:
 
         return None
 
+    def _prefetch_dspace_persons(self, rows, dspace_results):
+        """
+        Resolve exact-identifier DSpace person queries in batches.
+
+        For every row, the identifier queries that `reconcile_authors` sends
+        before its name lookup are grouped by field and sent as OR-joined
+        searches: sciper and ORCID, plus the Scopus author id / ResearcherID
+        for rows without an author name (otherwise those only run once the
+        name lookup has failed). Definite answers, misses included, are stored
+        in `dspace_results` under the same query string the per-row lookup
+        uses; only matches go to the persistent cache. Anything the batch
+        could not settle is left to the per-row lookup.
+
+        Args:
+            rows (iterable): Author rows (dicts), one per distinct author.
+            dspace_results (dict): Per-run DSpace results keyed by query string.
+        """
+        def is_valid(value):
+            return value is not None and pd.notna(value) and str(value).strip() != ""
+
+        wanted = {}  # field -> {raw value -> query string}
+        for row in rows:
+            candidates = [
+                ("epfl.sciperId", row.get("sciper_id")),
+                ("person.identifier.orcid", row.get("orcid_id")),
+            ]
+            if not is_valid(row.get("author")):
+                if row.get("source") == "scopus":
+                    candidates.append(("person.identifier.scopus-author-id", row.get("internal_author_id")))
+                if row.get("source") == "wos":
+                    candidates.append(("person.identifier.rid", row.get("internal_author_id")))
+            for field, value in candidates:
+                if not is_valid(value):
+                    continue
+                query = f"{field}:({value})"
+                if query in dspace_results:
+                    continue
+                cached = self.lookup_cache.get("dspace_person", query)
+                if cached is not None:
+                    dspace_results[query] = cached
+                    continue
+                wanted.setdefault(field, {})[value] = query
+
+        for field, queries in wanted.items():
+            with get_service_limit("dspace"):
+                resolved = self.dspace_wrapper.find_persons_by_identifier(field, queries)
+            for value, query in queries.items():
+                key = str(value).strip()
+                if key in resolved:
+                    dspace_results[query] = resolved[key]
+                    if resolved[key] is not None:
+                        self.lookup_cache.set("dspace_person", query, resolved[key])
+
     def reconcile_authors(self, return_df=False):
-        self.df = self.df.copy()
+        self.df = self.df.copy(deep=False)
         cache = {}
-
-        def make_cache_key(row):
-            orcid = row.get("orcid_id")
-            if orcid and str(orcid).strip():
+        # DSpace person lookups keyed by query string: rows with different
+        # cache keys (e.g. same name, different ORCID) often share queries
+        dspace_results = {}
+        # EPFL API person answers for this run only, keyed like the lookup cache
+        epfl_results = {}
+
+        def is_present(value):
+            # Plain checks instead of pd.notna on every scalar. NaN is truthy (and
+            # NaN != NaN): a missing ORCID must not become the key "orcid:nan"
+            if isinstance(value, str):
+                return value.strip() != ""
+            return value is not None and value is not pd.NA and value == value
+
+        def make_cache_key(orcid, internal_author_id, source, author_cleaned, firstname, lastname):
+            if is_present(orcid):
                 return f"orcid:{orcid}"
 
-            internal_author_id = row.get("internal_author_id")
-            source = row.get("source")
-            if (
-                internal_author_id
-                and str(internal_author_id).strip()
-                and source in ["scopus", "wos"]
-            ):
+            if is_present(internal_author_id) and source in ("scopus", "wos"):
                 return f"{source}:{internal_author_id}"
 
-            author_cleaned = row.get("author_cleaned")
-            if author_cleaned and str(author_cleaned).strip():
+            if is_present(author_cleaned):
                 return f"name:{author_cleaned}"
 
-            firstname = clean_value(row.get("nameparse_firstname", ""))
-            lastname = clean_value(row.get("nameparse_lastname", ""))
+            firstname = clean_value(firstname) if isinstance(firstname, str) else ""
+            lastname = clean_value(lastname) if isinstance(lastname, str) else ""
             if firstname and lastname:
                 return f"fullname:{firstname} {lastname}"
 
@@ -510,64 +788,66 @@ class AuthorProcessor:
                 queries.append(f"person.identifier.rid:({row['internal_author_id']})")
 
             for query in queries:
-                self.logger.debug("DSpace person lookup: %s", query)
-                try:
-                    result = self.dspace_wrapper.find_person(query=query)
-                    if isinstance(result, dict) and all(
-                        k in result for k in ["uuid", "sciper_id"]
-                    ):
-                        return result["uuid"], result["sciper_id"]
-                except Exception as e:
-                    self.logger.error(
-                        "Error querying DSpace for query '%s': %s", query, str(e)
+                if query in dspace_results:
+                    result = dspace_results[query]
+                else:
+                    # Only identifier lookups are stable across runs; a name can
+                    # match someone else once more persons are added to DSpace
+                    persistent = not query.startswith("itemauthoritylookup:")
+                    result = (
+                        self.lookup_cache.get("dspace_person", query) if persistent else None
                     )
+                    if result is None:
+                        self.logger.debug("DSpace person lookup: %s", query)
+                        try:
+                            with get_service_limit("dspace"):
+                                result = self.dspace_wrapper.find_person(query=query)
+                        except Exception as e:
+                            self.logger.error(
+                                "Error querying DSpace for query '%s': %s", query, str(e)
+                            )
+                            continue
+                        if persistent:
+                            self.lookup_cache.set("dspace_person", query, result)
+                    dspace_results[query] = result
+
+                if isinstance(result, dict) and all(
+                    k in result for k in ["uuid", "sciper_id"]
+                ):
+                    return result["uuid"], result["sciper_id"]
 
             return None, None
 
-        def query_and_enrich_person(row):
+        def get_epfl_person(lookup_key, **query_kwargs):
+            if lookup_key in epfl_results:
+                return epfl_results[lookup_key]
+            person_info = self.lookup_cache.get("epfl_person", lookup_key)
+            if person_info is None:
+                with get_service_limit("epfl_api"):
+                    person_info = ApiEpflClient.query_person(format="digest", **query_kwargs)
+                if isinstance(person_info, dict):
+                    self.lookup_cache.set("epfl_person", lookup_key, person_info)
+            epfl_results[lookup_key] = person_info
+            return person_info
+
+        def resolve_person(row):
             """
-            Enriches author metadata by reconciling identifiers (sciper, ORCID, internal IDs) 
-            and inferring their most likely EPFL unit affiliation at the time of publication.
+            Reconciles author identifiers (sciper, ORCID, internal IDs) against DSpace
+            and the EPFL API.
 
             This function performs the following steps:
             1. Tries to find the author in DSpace to get the sciper ID and internal UUID.
             2. Uses the sciper or name information to query the EPFL API for additional metadata.
-            3. Retrieves unit information from EPFL API (current accreditation).
-            4. Infers the most likely unit of affiliation at the time of publication using DSpace facet data.
-            5. Compares both units (API vs guessed) to determine concordance.
-            6. Chooses the most reliable unit as final_mainunit (priority: EPFL API over Infoscience guessed).
 
             Args:
-                row (pd.Series): A row from the DataFrame representing one author/publication entry.
+                row (dict): A row from the DataFrame representing one author/publication entry.
 
             Returns:
-                dict: Enriched author information, including:
-                    - sciper_id, epfl_orcid, epfl_status, epfl_position
-                    - epfl_api_mainunit_id / name / type
-                    - dspace_uuid
-                    - guessing_mainunit
-                    - mainunit_match (bool)
-                    - final_mainunit (str)
+                dict: Result container with sciper_id, epfl_orcid, epfl_status,
+                    epfl_position and dspace_uuid populated when found.
             """
-            key = make_cache_key(row)
-            if key in cache:
-                self.logger.debug("Returned cached data for key %s", key)
-                return cache[key]
-
             # Initialize result container
-            result = {
-                "sciper_id": None,
-                "epfl_status": None,
-                "epfl_position": None,
-                "epfl_orcid": None,
-                "epfl_api_mainunit_id": None,
-                "epfl_api_mainunit_name": None,
-                "epfl_api_mainunit_type": None,
-                "dspace_uuid": None,
-                "guessing_mainunit": None,
-                "mainunit_match": None,
-                "final_mainunit": None,
-            }
+            result = dict.fromkeys(_RECONCILIATION_COLUMNS)
 
             # Step 1: Query DSpace for sciper and uuid
             uuid, dspace_sciper = get_dspace_data(row)
@@ -576,21 +856,21 @@ class AuthorProcessor:
 
             # Step 2: Query EPFL API (by sciper if possible, fallback to name)
             if sciper_id:
-                person_info = ApiEpflClient.query_person(
-                    query=sciper_id, format="digest", use_firstname_lastname=False
+                person_info = get_epfl_person(
+                    f"sciper:{sciper_id}", query=sciper_id, use_firstname_lastname=False
                 )
             else:
                 firstname = clean_value(row.get("nameparse_firstname", ""))
                 lastname = clean_value(row.get("nameparse_lastname", ""))
-                person_info = ApiEpflClient.query_person(
+                person_info = get_epfl_person(
+                    f"name:{row.get('author_cleaned')}|{firstname}|{lastname}",
                     query=row.get("author_cleaned"),
                     firstname=firstname,
                     lastname=lastname,
-                    format="digest",
                     use_firstname_lastname=True,
                 )
 
-            # Step 3: Populate EPFL metadata if available
+            # Populate EPFL metadata if available
             if isinstance(person_info, dict):
                 result.update({
                     "sciper_id": person_info.get("sciper_id"),
@@ -599,13 +879,39 @@ class AuthorProcessor:
                     "epfl_position": person_info.get("epfl_position"),
                 })
 
-                if person_info.get("sciper_id"):
-                    uid, uname, utype = self._fetch_accred_info(person_info["sciper_id"])
-                    result.update({
-                        "epfl_api_mainunit_id": uid,
-                        "epfl_api_mainunit_name": uname,
-                        "epfl_api_mainunit_type": utype,
-                    })
+            return result
+
+        def enrich_person_units(row, result):
+            """
+            Infers the author's most likely EPFL unit affiliation at the time of publication.
+
+            This function performs the following steps:
+            3. Retrieves unit information from EPFL API (current accreditation).
+            4. Infers the most likely unit of affiliation at the time of publication using DSpace facet data.
+            5. Compares both units (API vs guessed) to determine concordance.
+            6. Chooses the most reliable unit as final_mainunit (priority: EPFL API over Infoscience guessed).
+
+            Args:
+                row (dict): A row from the DataFrame representing one author/publication entry.
+                result (dict): The container returned by resolve_person for this row.
+
+            Returns:
+                dict: Enriched author information, including:
+                    - sciper_id, epfl_orcid, epfl_status, epfl_position
+                    - epfl_api_mainunit_id / name / type
+                    - dspace_uuid
+                    - guessing_mainunit
+                    - mainunit_match (bool)
+                    - final_mainunit (str)
+            """
+            # Step 3: Current accreditation from the EPFL API (cache warmed beforehand)
+            if result.get("sciper_id"):
+                uid, uname, utype = self._fetch_accred_info(result["sciper_id"])
+                result.update({
+                    "epfl_api_mainunit_id": uid,
+                    "epfl_api_mainunit_name": uname,
+                    "epfl_api_mainunit_type": utype,
+                })
 
             # Step 4: Guess unit at publication date from DSpace facets
             year = row.get("year")
@@ -640,10 +946,67 @@ class AuthorProcessor:
                     result["guessing_mainunit"] or result["epfl_api_mainunit_name"]
                 )
 
-            cache[key] = result
             return result
 
-        enrichment_df = self.df.apply(query_and_enrich_person, axis=1, result_type="expand")
+        # Resolve each distinct author once: rows sharing a cache key reuse the
+        # result computed for the first row carrying that key. Rows without any
+        # identifier get a key of their own rather than sharing one result.
+        # Keys are built from the raw column arrays; row dicts are only
+        # materialised for the first row of each key.
+        def column(name):
+            if name in self.df.columns:
+                return self.df[name].to_numpy(dtype=object)
+            return np.full(len(self.df), None, dtype=object)
+
+        key_columns = zip(
+            column("orcid_id"),
+            column("internal_author_id"),
+            column("source"),
+            column("author_cleaned"),
+            column("nameparse_firstname"),
+            column("nameparse_lastname"),
+        )
+        keys = [
+            make_cache_key(*values) or f"row:{position}"
+            for position, values in enumerate(key_columns)
+        ]
+        first_positions = {}
+        for position, key in enumerate(keys):
+            first_positions.setdefault(key, position)
+        unique_keys = list(first_positions)
+        first_rows = dict(zip(
+            unique_keys,
+            self.df.iloc[list(first_positions.values())].to_dict("records"),
+        ))
+
+        # Identifier lookups (ORCID, Scopus / WoS author ids) are batched up front
+        self._prefetch_dspace_persons(first_rows.values(), dspace_results)
+
+        # DSpace / EPFL API lookups are network-bound: resolve distinct authors
+        # concurrently
+        identities = dict(zip(
+            unique_keys,
+            self.executor.map(lambda key: resolve_person(first_rows[key]), unique_keys),
+        ))
+
+        # Accreditations only depend on the sciper: fetch them concurrently
+        self._prefetch_accred_info(
+            {r["sciper_id"] for r in identities.values() if r["sciper_id"]}
+        )
+
+        cache.update(zip(
+            unique_keys,
+            self.executor.map(
+                lambda key: enrich_person_units(first_rows[key], identities[key]),
+                unique_keys,
+            ),
+        ))
+
+        enrichment_df = pd.DataFrame(
+            [cache[key] for key in keys],
+            index=self.df.index,
+            columns=_RECONCILIATION_COLUMNS,
+        )
         self.df = pd.concat([self.df, enrichment_df], axis=1)
 
         total   = len(self.df)
@@ -657,68 +1020,102 @@ class AuthorProcessor:
 
 class PublicationProcessor: 
 
-    def __init__(self, df, unpaywall_format="best-oa-location"):
+    def __init__(
+        self,
+        df,
+        unpaywall_format="best-oa-location",
+        executor: ThreadPoolExecutor = None,
+    ):
         self.df = df
         self.unpaywall_format = unpaywall_format 
         self.logger = logger
+        # Allow injection for testing; fall back to the shared pool if not provided.
+        self._executor = executor
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = get_shared_executor()
+        return self._executor
 
     def fetch_unpaywall_data(self, doi):
-        return UnpaywallClient.fetch_by_doi(doi, format=self.unpaywall_format)
+        # Held for the whole lookup, including any PDF download it triggers
+        with get_service_limit("unpaywall"):
+            return UnpaywallClient.fetch_by_doi(doi, format=self.unpaywall_format)
 
     def process(self, return_df=True):
-        self.df = self.df.copy()
-
-        # Initialisation des colonnes
-        self.df["upw_is_oa"] = pd.NA
-        self.df["upw_is_oa"] = self.df["upw_is_oa"].astype("boolean")  # Nullable boolean
-        self.df["upw_oa_status"] = None
-        self.df["journal_is_oa"] = None
-        self.df["journal_is_in_doaj"] = None
-        self.df["upw_license"] = None
-        self.df["upw_version"] = None
-        self.df["upw_host"] = None
-        self.df["upw_oai_id"] = None
-        self.df["upw_pdf_urls"] = None
-        self.df["upw_valid_pdf"] = None
-
-        # Filtrer uniquement les lignes avec un DOI valide
-        valid_dois = self.df["doi"].dropna()
-        valid_indexes = valid_dois.index
-
-        # Récupérer les données Unpaywall en parallèle
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(executor.map(self.fetch_unpaywall_data, valid_dois))
-
-        # Injecter les résultats dans le DataFrame original
-        for index, result in zip(valid_indexes, results):
-            if result is not None:
-                self.df.at[index, "upw_is_oa"] = bool(result.get("is_oa"))
-                self.df.at[index, "upw_oa_status"] = result.get("oa_status")
-                self.df.at[index, "journal_is_oa"] = result.get("journal_is_oa")
-                self.df.at[index, "journal_is_in_doaj"] = result.get("journal_is_in_doaj")
-                self.df.at[index, "upw_license"] = result.get("license")
-                self.df.at[index, "upw_version"] = result.get("version")
-                self.df.at[index, "upw_host"] = result.get("host_type")
-                self.df.at[index, "upw_oai_id"] = result.get("pmh_id")
-
-                if self.unpaywall_format == "best-oa-location":
-                    self.df.at[index, "upw_pdf_urls"] = result.get("pdf_urls")
-                    # Publisher-specific or implied-OA licences are NOT truly open:
-                    # the PDF may be freely viewable but redistribution is restricted.
-                    # Block upw_valid_pdf so the loader never tries to attach these files.
-                    _lic = str(result.get("license") or "").lower().strip()
-                    _is_open_license = _lic.startswith("cc-") or _lic in ("public-domain", "pd")
-                    # None (not False) — the loader treats valid_pdf as a filename
-                    # string and does `pdf_dir / valid_pdf`; a boolean would crash it.
-                    valid_pdf = result.get("valid_pdf") if _is_open_license else None
-                    self.df.at[index, "upw_valid_pdf"] = valid_pdf
-                else:
-                    self.df.at[index, "upw_pdf_urls"] = None
-                    self.df.at[index, "upw_valid_pdf"] = None
-            else:
-                self.logger.warning(
-                    "No unpaywall data returned for DOI %s.", self.df.at[index, "doi"]
-                )
+        # Output columns, preallocated and filled by position, then assigned once
+        n_rows = len(self.df)
+        upw_is_oa = np.full(n_rows, pd.NA, dtype=object)
+        columns = {
+            col: np.full(n_rows, None, dtype=object)
+            for col in (
+                "upw_oa_status",
+                "journal_is_oa",
+                "journal_is_in_doaj",
+                "upw_license",
+                "upw_version",
+                "upw_host",
+                "upw_oai_id",
+                "upw_pdf_urls",
+                "upw_valid_pdf",
+            )
+        }
+
+        # Filtrer uniquement les lignes avec un DOI valide: as in the
+        # deduplicator, NaN, blank and "None" DOIs count as missing. Rows are
+        # addressed by position so results stay aligned whatever the index.
+        dois = self.df["doi"]
+        has_doi = dois.notna() & ~dois.astype(str).str.strip().isin(["", "None"])
+        positions = np.flatnonzero(has_doi.to_numpy())
+        valid_dois = self.df["doi"].iloc[positions].tolist()
+
+        # Récupérer les données Unpaywall en parallèle, une seule fois par DOI
+        unique_dois = list(dict.fromkeys(valid_dois))
+        results_by_doi = dict(
+            zip(
+                unique_dois,
+                self.executor.map(self.fetch_unpaywall_data, unique_dois),
+            )
+        )
+        for doi, result in results_by_doi.items():
+            if result is None:
+                self.logger.warning("No unpaywall data returned for DOI %s.", doi)
+
+        for pos, doi in zip(positions, valid_dois):
+            result = results_by_doi[doi]
+            if result is None:
+                continue
+
+            upw_is_oa[pos] = bool(result.get("is_oa"))
+            columns["upw_oa_status"][pos] = result.get("oa_status")
+            columns["journal_is_oa"][pos] = result.get("journal_is_oa")
+            columns["journal_is_in_doaj"][pos] = result.get("journal_is_in_doaj")
+            columns["upw_license"][pos] = result.get("license")
+            columns["upw_version"][pos] = result.get("version")
+            columns["upw_host"][pos] = result.get("host_type")
+            columns["upw_oai_id"][pos] = result.get("pmh_id")
+
+            if self.unpaywall_format == "best-oa-location":
+                columns["upw_pdf_urls"][pos] = result.get("pdf_urls")
+                # Publisher-specific or implied-OA licences are NOT truly open:
+                # the PDF may be freely viewable but redistribution is restricted.
+                # Block upw_valid_pdf so the loader never tries to attach these files.
+                _lic = str(result.get("license") or "").lower().strip()
+                _is_open_license = _lic.startswith("cc-") or _lic in ("public-domain", "pd")
+                # None (not False) — the loader treats valid_pdf as a filename
+                # string and does `pdf_dir / valid_pdf`; a boolean would crash it.
+                valid_pdf = result.get("valid_pdf") if _is_open_license else None
+                columns["upw_valid_pdf"][pos] = valid_pdf
+
+        # Explicit object dtype keeps None (not NaN) for missing values
+        self.df = self.df.assign(
+            upw_is_oa=pd.array(upw_is_oa, dtype="boolean"),  # Nullable boolean
+            **{
+                col: pd.Series(values, index=self.df.index, dtype=object)
+                for col, values in columns.items()
+            },
+        )
 
         return self.df if return_df else self
 
@@ -758,43 +1155,46 @@ class OpenAlexProcessor:
         Returns:
             pd.DataFrame or OpenAlexProcessor: Enriched DataFrame or self.
         """
-        self.df = self.df.copy()
-        dois = self.df["doi"].dropna()
+        # Rows are addressed by position so results can be written column-wise
+        positions = np.flatnonzero(self.df["doi"].notna().to_numpy())
+        dois = self.df["doi"].iloc[positions].tolist()
         results = []
 
-        # Traitement DOI par DOI
-        for i, (index, doi) in enumerate(zip(dois.index, dois), 1):
+        # Fetch DOI by DOI
+        for i, (pos, doi) in enumerate(zip(positions, dois), 1):
             self.logger.info(f"[{i}/{len(dois)}] Fetching OpenAlex data for DOI: {doi}")
             try:
                 result = self.fetch_openalex_data(doi)
-                results.append((index, result))
+                results.append((pos, doi, result))
             except Exception as e:
                 self.logger.warning(f"Failed to fetch data for DOI {doi}: {e}")
-                results.append((index, None))
-            time.sleep(1.0)  # pour respecter les limites de l’API
+                results.append((pos, doi, None))
+            time.sleep(1.0)  # respect the API rate limits
 
-        # Collecte de toutes les clés uniques retournées
+        # Collect every key returned
         all_keys = set()
-        for _, result in results:
+        for _, _, result in results:
             if isinstance(result, dict):
                 all_keys.update(result.keys())
 
-        # Création des colonnes si absentes
+        # Fill one array per output column (existing values kept for rows without
+        # data), then assign all columns at once instead of per-cell .at writes
+        new_columns = {}
         for key in sorted(all_keys):
             col_name = f"{self.openalex_prefix}{key}"
-            if col_name not in self.df.columns:
-                self.df[col_name] = pd.NA
-
-        # Injection des données dans le DataFrame
-        for index, result in results:
-            if isinstance(result, dict):
-                for key in all_keys:
-                    col_name = f"{self.openalex_prefix}{key}"
-                    value = result.get(key, pd.NA)
-                    self.df.at[index, col_name] = value
+            if col_name in self.df.columns:
+                values = self.df[col_name].to_numpy(dtype=object, copy=True)
             else:
-                self.logger.warning(
-                    f"No OpenAlex data returned for DOI {self.df.at[index, 'doi']}"
-                )
+                values = np.full(len(self.df), pd.NA, dtype=object)
+            for pos, _, result in results:
+                if isinstance(result, dict):
+                    values[pos] = result.get(key, pd.NA)
+            new_columns[col_name] = pd.Series(values, index=self.df.index, dtype=object)
+
+        for _, doi, result in results:
+            if not isinstance(result, dict):
+                self.logger.warning(f"No OpenAlex data returned for DOI {doi}")
+
+        self.df = self.df.assign(**new_columns)
 
         return self.df if return_df else self
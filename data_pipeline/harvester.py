@@ -7,7 +7,11 @@ import time
 from collections import defaultdict
 import pandas as pd
 import json
-from data_pipeline.enricher import AuthorProcessor
+from data_pipeline.enricher import (
+    AuthorProcessor,
+    get_service_limit,
+    get_shared_executor,
+)
 from clients.wos_client_v2 import WosClient
 from clients.scopus_client import ScopusClient
 from clients.zenodo_client import ZenodoClient
@@ -51,6 +55,32 @@ class Harvester(abc.ABC):
         """
         pass
 
+    def _fetch_pages(self, service, fetch_page, starts) -> list:
+        """
+        Fetch result pages concurrently and return their records in page order.
+
+        Pages run on the shared pool, each one holding the service limit of
+        `service` (e.g. WOS_MAX_CONCURRENCY), so the provider never sees more
+        parallel requests than its per-key rate limit allows.
+
+        :param service: Service limit name ("wos", "scopus" or "crossref")
+        :param fetch_page: Callable returning the list of records of the page at `start`
+        :param starts: Page offsets (or page numbers) to fetch
+        :return: Records of all pages, concatenated in the order of `starts`
+        """
+        limit = get_service_limit(service)
+
+        def fetch_limited(start):
+            with limit:
+                return fetch_page(start)
+
+        pages = get_shared_executor().map(fetch_limited, starts)
+
+        recs = []
+        for page in pages:
+            recs.extend(page)
+        return recs
+
     def harvest(self) -> pd.DataFrame:
         """
         Harvest publications from the source.
@@ -112,19 +142,20 @@ class WosHarvester(Harvester):
                 createdTimeSpan=createdTimeSpan,
             )
         else:
-            for i in range(1, total + 1, count):
+            def fetch_page(i):
                 self.logger.debug(
                     "[WOS] Fetching records %d–%d / %d",
                     i, min(i + count - 1, total), total
                 )
-                h_recs = WosClient.fetch_records(
+                return WosClient.fetch_records(
                     format=self.format,
                     usrQuery=self.query,
                     count=count,
                     firstRecord=i,
                     createdTimeSpan=createdTimeSpan,
                 )
-                recs.extend(h_recs)
+
+            recs = self._fetch_pages("wos", fetch_page, range(1, total + 1, count))
         df = (
             pd.DataFrame(recs)
             .query('ifs3_collection != "unknown"')
@@ -187,15 +218,16 @@ class ScopusHarvester(Harvester):
                 format=self.format, query=updated_query, count=1, start=0
             )
         else:
-            for i in range(0, total, count):
+            def fetch_page(i):
                 self.logger.debug(
                     "[Scopus] Fetching records %d–%d / %d",
                     i + 1, min(i + count, total), total
                 )
-                h_recs = ScopusClient.fetch_records(
+                return ScopusClient.fetch_records(
                     format=self.format, query=updated_query, count=count, start=i
                 )
-                recs.extend(h_recs)
+
+            recs = self._fetch_pages("scopus", fetch_page, range(0, total, count))
 
         # Keep only valid ifs3 doctypes
         df = (
@@ -427,8 +459,8 @@ class CrossrefHarvester(Harvester):
             return []
 
         count = 50
-        recs = []
-        for offset in range(0, int(total), count):
+
+        def fetch_page(offset):
             self.logger.debug(
                 "[Crossref] Fetching records %d–%d / %d",
                 offset + 1, min(offset + count, int(total)), int(total),
@@ -438,12 +470,13 @@ class CrossrefHarvester(Harvester):
                     format=self.format, rows=count, offset=offset, **params,
                 )
                 if h_recs:
-                    recs.extend(h_recs)
-                else:
-                    self.logger.warning("[Crossref] No records at offset %d", offset)
+                    return h_recs
+                self.logger.warning("[Crossref] No records at offset %d", offset)
             except Exception as e:
                 self.logger.error("[Crossref] Error at offset %d: %s", offset, e)
-        return recs
+            return []
+
+        return self._fetch_pages("crossref", fetch_page, range(0, int(total), count))
 
     def fetch_and_parse_publications(self) -> pd.DataFrame:
         """
@@ -714,10 +747,11 @@ class DataCiteHarvester(Harvester):
         primary = set(df["internal_id"])
         # Build graph
         neigh: dict[str, set[str]] = defaultdict(set)
-        for _, row in df.iterrows():
-            me = row["internal_id"]
-            for doi in self._parse_versions(row["HasVersion"]) + self._parse_versions(
-                row["IsVersionOf"]
+        for me, has_version, is_version_of in df[
+            ["internal_id", "HasVersion", "IsVersionOf"]
+        ].itertuples(index=False, name=None):
+            for doi in self._parse_versions(has_version) + self._parse_versions(
+                is_version_of
             ):
                 if doi in primary:
                     neigh[me].add(doi)
@@ -223,7 +223,7 @@ class Loader:
         roles_metadata = []
 
         # Build metadata blocks
-        for _, author_row in subset.iterrows():
+        for author_row in subset.to_dict("records"):
             authors_metadata.append(
                 create_metadata(str(author_row.get("author", "")).strip())
             )
@@ -261,7 +261,7 @@ class Loader:
             if matching_epfl_author.empty:
                 continue
 
-            for _, match in matching_epfl_author.iterrows():
+            for match in matching_epfl_author.to_dict("records"):
                 sciper = match.get("sciper_id")
                 if pd.notna(sciper):
                     prefix = (
@@ -340,7 +340,7 @@ class Loader:
         orcids_meta = []
 
         # Build blocks in order
-        for _, row in subset.iterrows():
+        for row in subset.to_dict("records"):
             name = str(row.get("author", "")).strip()
             if not name:
                 # Skip malformed entries
@@ -374,7 +374,8 @@ class Loader:
                 & (self.df_epfl_authors["author"] == name)
             ]
             if not matching_epfl.empty:
-                for _, m in matching_epfl.iterrows():
+                matches = matching_epfl.to_dict("records")
+                for m in matches:
                     sciper = m.get("sciper_id")
                     if pd.notna(sciper):
                         prefix = (
@@ -388,7 +389,7 @@ class Loader:
 
                 # If EPFL affiliation is confirmed in match, override affiliation with EPFL + ROR authority
                 if any(
-                    pd.notna(m.get("organizations")) for _, m in matching_epfl.iterrows()
+                    pd.notna(m.get("organizations")) for m in matches
                 ):
                     affils_meta[-1] = {
                         "value": "École Polytechnique Fédérale de Lausanne",
@@ -1577,7 +1578,9 @@ class Loader:
             return df_items_imported
 
         logger.info("Loading %d publication(s) into DSpace", len(df_items_to_import))
-        for index, row in df_items_to_import.iterrows():
+        for index, row in zip(
+            df_items_to_import.index, df_items_to_import.to_dict("records")
+        ):
             source = row.get("source", "")
             source_id = row.get("internal_id", "")
             collection_id = row.get("ifs3_collection_id", "")
@@ -1620,7 +1623,7 @@ class Loader:
                 ]
                 units = [
                     {"acro": author["final_mainunit"]}
-                    for _, author in matching_authors.iterrows()
+                    for author in matching_authors.to_dict("records")
                     if pd.notna(author["final_mainunit"])
                     and author["final_mainunit"] != ""
                 ]
@@ -25,6 +25,7 @@ from data_pipeline.enricher import AuthorProcessor, PublicationProcessor
 from data_pipeline.loader import Loader
 from data_pipeline.reporting import GenerateReports
 from db.pipeline_db import PipelineDB
+from db.lookup_cache import LookupCache
 from data_pipeline.harvester import (
     WosHarvester,
     ScopusHarvester,
@@ -362,7 +363,14 @@ def run_pipeline(
     if df_authors.empty:
         df_epfl_authors = pd.DataFrame()
     else:
-        ap = AuthorProcessor(df_authors)
+        # Reuse the DSpace session authenticated for the Infoscience dedup
+        lookup_cache = LookupCache(env_loader.lookup_cache_path())
+        lookup_cache.purge_expired()
+        ap = AuthorProcessor(
+            df_authors,
+            dspace_client=deduplicator.dspace_wrapper,
+            lookup_cache=lookup_cache,
+        )
         df_epfl_authors = (
             ap.process(author_ids_to_check=author_ids)
             .filter_epfl_authors()
@@ -0,0 +1,176 @@
+"""Persistent cache for remote reconciliation lookups.
+
+Author reconciliation asks DSpace the same questions on every run (the same
+scipers and ORCIDs come back week after week). Answers are kept in a small
+SQLite file next to the pipeline DuckDB file so that later runs reuse them
+instead of going back to the network.
+
+Storage strategy:
+  One SQLite file per environment (``data/lookup_cache_{env}.sqlite``); the
+  caller passes the path in (main.py uses ``env_loader.lookup_cache_path()``).
+  SQLite rather than the pipeline DuckDB file: lookups happen from the
+  enrichment thread pool while the UI may hold the DuckDB write lock.
+  Values are JSON-encoded and expire after ``ttl_days``, or after the TTL
+  given for their namespace in ``namespace_ttl_days`` (0 keeps a namespace
+  out of the file). Only mappings that do not change between runs belong
+  here, such as DSpace identifier -> person UUID; EPFL API answers (status,
+  position, main unit) are only persisted when explicitly opted in. Only
+  positive answers are stored by callers, so a person who appears in DSpace
+  is picked up on the next run.
+  Any SQLite error is logged and treated as a cache miss: the cache never
+  makes a lookup fail.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger("pipeline.lookup_cache")
+
+
+def _env_ttl_days(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        logger.warning("Invalid %s, using %s", name, default)
+        return float(default)
+
+
+def _default_ttl_days() -> float:
+    from config import lookup_cache_ttl_days
+    return _env_ttl_days("LOOKUP_CACHE_TTL_DAYS", lookup_cache_ttl_days)
+
+
+def _default_namespace_ttl_days() -> dict:
+    """EPFL API answers change (unit moves, departures): one run unless opted in."""
+    from config import epfl_lookup_cache_ttl_days
+    ttl = _env_ttl_days("EPFL_LOOKUP_CACHE_TTL_DAYS", epfl_lookup_cache_ttl_days)
+    return {"epfl_person": ttl, "epfl_accred": ttl}
+
+
+class LookupCache:
+    """Namespaced key/value cache with expiry, safe to share between threads.
+
+    Without a ``path``, or with a ``ttl_days`` of 0 (or less), the cache is
+    disabled: ``get`` always misses and ``set`` does nothing. ``namespace_ttl_days`` overrides the TTL of
+    individual namespaces, with the same meaning for 0.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        ttl_days: Optional[float] = None,
+        namespace_ttl_days: Optional[dict] = None,
+    ):
+        self.ttl_days = _default_ttl_days() if ttl_days is None else float(ttl_days)
+        if namespace_ttl_days is None:
+            namespace_ttl_days = _default_namespace_ttl_days()
+        self.namespace_ttl_days = {
+            namespace: float(ttl) for namespace, ttl in namespace_ttl_days.items()
+        }
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._conn = None
+        if self.enabled:
+            self._open()
+
+    @property
+    def enabled(self) -> bool:
+        if self.path is None:
+            return False
+        return self.ttl_days > 0 or any(
+            ttl > 0 for ttl in self.namespace_ttl_days.values()
+        )
+
+    def _ttl_days(self, namespace: str) -> float:
+        return self.namespace_ttl_days.get(namespace, self.ttl_days)
+
+    def _open(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=10)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error as e:
+            logger.warning("Lookup cache disabled, cannot open %s: %s", self.path, e)
+            self._conn = None
+
+    def get(self, namespace: str, key) -> Any:
+        """Return the cached value, or None when absent, expired or disabled."""
+        ttl_days = self._ttl_days(namespace)
+        if self._conn is None or ttl_days <= 0:
+            return None
+        min_stored_at = time.time() - ttl_days * 86400
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM lookups"
+                    " WHERE namespace = ? AND key = ? AND stored_at >= ?",
+                    (namespace, str(key), min_stored_at),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Lookup cache read failed (%s/%s): %s", namespace, key, e)
+            return None
+        return json.loads(row[0]) if row else None
+
+    def set(self, namespace: str, key, value) -> None:
+        """Store a JSON-serialisable value; None values are ignored."""
+        if self._conn is None or value is None or self._ttl_days(namespace) <= 0:
+            return
+        try:
+            payload = json.dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lookups (namespace, key, value, stored_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (namespace, str(key), payload, time.time()),
+                )
+                self._conn.commit()
+        except (TypeError, ValueError, sqlite3.Error) as e:
+            logger.warning("Lookup cache write failed (%s/%s): %s", namespace, key, e)
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed.
+
+        Namespaces whose TTL is 0 are emptied, so answers stored under an
+        earlier, longer TTL are not kept around.
+        """
+        if self._conn is None:
+            return 0
+        now = time.time()
+        overrides = list(self.namespace_ttl_days)
+        not_overridden = (
+            f" AND namespace NOT IN ({', '.join('?' * len(overrides))})"
+            if overrides else ""
+        )
+        try:
+            with self._lock:
+                removed = self._conn.execute(
+                    "DELETE FROM lookups WHERE stored_at < ?" + not_overridden,
+                    (now - self.ttl_days * 86400, *overrides),
+                ).rowcount
+                for namespace, ttl_days in self.namespace_ttl_days.items():
+                    removed += self._conn.execute(
+                        "DELETE FROM lookups WHERE namespace = ? AND stored_at < ?",
+                        (namespace, now - ttl_days * 86400 if ttl_days > 0 else now + 1),
+                    ).rowcount
+                self._conn.commit()
+                return removed
+        except sqlite3.Error as e:
+            logger.warning("Lookup cache purge failed: %s", e)
+            return 0
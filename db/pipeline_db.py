@@ -471,7 +471,7 @@ class PipelineDB:
         rp_rows = []     # for run_publications insert
 
         def _process(df, status_override, error_override=None):
-            for _, row in df.iterrows():
+            for row in df.to_dict("records"):
                 doi = s(row.get("doi"))
                 source = s(row.get("source"))
                 internal_id = s(row.get("internal_id"))
@@ -545,7 +545,7 @@ class PipelineDB:
             return
         s = self._safe
         rows, seen = [], set()
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             sciper = s(row.get("sciper_id"))
             if not sciper or sciper in seen:
                 continue
@@ -590,7 +590,7 @@ class PipelineDB:
             return
         s = self._safe
         seen, rows = set(), []
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             acro = s(row.get("final_mainunit"))
             if not acro or acro in seen:
                 continue
@@ -615,7 +615,7 @@ class PipelineDB:
             return
         s = self._safe
         rows = [(run_id, s(r.get("row_id")), s(r.get("sciper_id")), s(r.get("role")))
-                for _, r in df.iterrows()
+                for r in df.to_dict("records")
                 if s(r.get("sciper_id")) and s(r.get("row_id"))]
         self._executemany(
             "INSERT OR IGNORE INTO pub_authors (run_id,row_id,sciper,role) VALUES (?,?,?,?)",
@@ -626,7 +626,7 @@ class PipelineDB:
             return
         s = self._safe
         seen, rows = set(), []
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             key = (run_id, s(row.get("row_id")), s(row.get("final_mainunit")))
             if None in key or key in seen:
                 continue
@@ -648,7 +648,7 @@ class PipelineDB:
         s = self._safe
         rows = [
             (run_id, s(r.get("row_id")), s(r.get("author")))
-            for _, r in df.iterrows()
+            for r in df.to_dict("records")
             if s(r.get("row_id")) and s(r.get("author")) and not s(r.get("sciper_id"))
         ]
         self._executemany(
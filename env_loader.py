@@ -19,6 +19,7 @@ Each environment owns its own files so prod and dev data never mix:
   data/pipeline_dev.duckdb   /  data/run_active_dev.json
   data/pipeline_test.duckdb  /  data/run_active_test.json
   data/pipeline_prod.duckdb  /  data/run_active_prod.json
+  (plus data/lookup_cache_{env}.sqlite for cached DSpace identifier lookups)
 
 Typical usage
 -------------
@@ -36,11 +37,14 @@ Typical usage
 
 from __future__ import annotations
 
+import logging
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+logger = logging.getLogger("pipeline.env_loader")
+
 ROOT = Path(__file__).resolve().parent
 
 ENVIRONMENTS: tuple[str, ...] = ("dev", "test", "prod")
@@ -112,3 +116,21 @@ def run_lock_path(env_name: str | None = None) -> Path:
     """Return the run-lock JSON path for the given (or active) environment."""
     env = env_name or get_active_env()
     return ROOT / "data" / f"run_active_{env}.json"
+
+
+def lookup_cache_path(env_name: str | None = None) -> Path:
+    """Return the reconciliation lookup cache path for the given (or active) environment."""
+    env = env_name or get_active_env()
+    return ROOT / "data" / f"lookup_cache_{env}.sqlite"
+
+
+def env_int(name: str, default: int) -> int:
+    """Return the integer setting ``name`` from the environment.
+
+    Falls back to ``default`` (with a warning) when the variable is malformed.
+    """
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning("Invalid %s, using %s", name, default)
+        return int(default)